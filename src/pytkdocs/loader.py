@@ -107,6 +107,22 @@ class ObjectNode:
         return self.parent_is_class() and isinstance(self.parent.obj.__dict__.get(self.name, None), classmethod)
 
 
+@lru_cache(maxsize=8192)
+def dedent_docstring(docstring: str) -> str:
+    """
+    Dedent a raw docstring.
+
+    Results are cached as identical docstrings are frequent (inherited or copied documentation).
+
+    Arguments:
+        docstring: The raw docstring.
+
+    Returns:
+        The dedented docstring.
+    """
+    return textwrap.dedent(docstring)
+
+
 def get_object_tree(path: str) -> ObjectNode:
     """
     Transform a path into an actual Python object.
@@ -330,7 +346,7 @@ class Loader:
             The documented class object.
         """
         class_ = node.obj
-        docstring = textwrap.dedent(class_.__doc__ or "")
+        docstring = dedent_docstring(class_.__doc__ or "")
         root_object = Class(name=node.name, path=node.dotted_path, file_path=node.file_path, docstring=docstring)
 
         if members is False:
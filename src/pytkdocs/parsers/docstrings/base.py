@@ -125,7 +125,7 @@ class Parser(metaclass=ABCMeta):
         """Initialization method."""
         self.object_path = ""
         self.object_signature: Optional[inspect.Signature] = None
-        self.object_type = None
+        self.object_type: object = None
         self.errors: List[str] = []
 
     def set_state(
@@ -1,9 +1,19 @@
 """This module defines functions and classes to parse docstrings into structured data."""
+import inspect
 import re
-from typing import Any, List, Optional, Pattern, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Pattern, Sequence, Tuple
 
 from pytkdocs.parsers.docstrings.base import AnnotatedObject, Parameter, Parser, Section, empty
 
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    # mypy_extensions is only needed when compiling this module with mypyc (see `make compile`)
+    def mypyc_attr(*attrs: Any, **kwattrs: Any) -> Any:  # type: ignore
+        """Return a decorator returning the decorated class untouched."""
+        return lambda cls: cls
+
+
 TITLES_PARAMETERS: Sequence[str] = ("args:", "arguments:", "params:", "parameters:")
 """Titles to match for "parameters" sections."""
 
@@ -13,11 +23,38 @@ TITLES_EXCEPTIONS: Sequence[str] = ("raise:", "raises:", "except:", "exceptions:
 TITLES_RETURN: Sequence[str] = ("return:", "returns:")
 """Titles to match for "returns" sections."""
 
+TITLES_SECTIONS: Dict[str, str] = {
+    **{title: Section.Type.PARAMETERS for title in TITLES_PARAMETERS},
+    **{title: Section.Type.EXCEPTIONS for title in TITLES_EXCEPTIONS},
+    **{title: Section.Type.RETURN for title in TITLES_RETURN},
+}
+"""Mapping of every lowercased section title to the type of the section it starts."""
+
+TITLES_MAX_LENGTH: int = max(len(title) for title in TITLES_SECTIONS)
+"""Length of the longest title: longer lines cannot be section titles."""
+
+TITLES_FIRST_CHARACTERS: FrozenSet[str] = frozenset(
+    character for title in TITLES_SECTIONS for character in (title[0], title[0].upper())
+)
+"""Characters a line must start with to be a section title."""
 
-RE_GOOGLE_STYLE_ADMONITION: Pattern = re.compile(r"^(?P<indent>\s*)(?P<type>[\w-]+):((?:\s+)(?P<title>.+))?$")
+RE_GOOGLE_STYLE_ADMONITION: Pattern[str] = re.compile(r"^(?P<indent>\s*)(?P<type>[\w-]+):((?:\s+)(?P<title>.+))?$")
 """Regular expressions to match lines starting admonitions, of the form `TYPE: [TITLE]`."""
 
+RE_CODE_FENCE: Pattern[str] = re.compile(r" *```")
+"""Regular expression to match lines opening or closing a fenced code block."""
+
+SplitSection = Tuple[str, str, Tuple[str, ...], int, Tuple[str, ...]]
+"""
+A section split from a docstring, before it is parsed.
+
+It contains the section type, its text (Markdown or return value), its items (parameters or exceptions),
+the line number it starts at, and the messages of the errors met while reading it.
+"""
+
 
+# allow subclassing the parser from Python code even when this module is compiled
+@mypyc_attr(allow_interpreted_subclasses=True)
 class Google(Parser):
     """A Google-style docstrings parser."""
 
@@ -30,76 +67,163 @@ class Google(Parser):
         """
         super().__init__()
         self.replace_admonitions = replace_admonitions
+        self._split_cache: Dict[Tuple[str, bool], Tuple[SplitSection, ...]] = {}
+        self._split_errors: Optional[List[str]] = None
+
+    def clear_cache(self) -> None:
+        """Forget the docstrings split so far."""
+        self._split_cache.clear()
+
+    def error(self, message: str) -> None:
+        """
+        Record a parsing error.
+
+        While a docstring is being split, the bare message is kept to be stored along the split sections.
+
+        Arguments:
+            message: A message described the error.
+        """
+        if self._split_errors is None:
+            super().error(message)
+        else:
+            self._split_errors.append(message)
 
     def parse_sections(self, docstring: str) -> List[Section]:  # noqa: D102
+        # splitting does not depend on the object being documented: it is cached for this parser,
+        # so identical docstrings of the same object tree (inherited or copied documentation) are split once
+        key = (docstring, self.replace_admonitions)
+        split = self._split_cache.get(key)
+        if split is None:
+            split = self._split_cache[key] = self.split_sections(docstring)
+
         sections = []
-        current_section = []
+        section: Optional[Section]
+
+        for section_type, text, items, start_index, errors in split:
+            for message in errors:
+                self.error(message)
+
+            if section_type == Section.Type.MARKDOWN:
+                section = Section(section_type, text)
+            elif section_type == Section.Type.PARAMETERS:
+                section = self.parse_parameters_block(items, start_index)
+            elif section_type == Section.Type.EXCEPTIONS:
+                section = self.parse_exceptions_block(items, start_index)
+            else:
+                section = self.parse_return_block(text, start_index)
+
+            if section:
+                sections.append(section)
+
+        return sections
+
+    def split_sections(self, docstring: str) -> Tuple[SplitSection, ...]:
+        """
+        Split a docstring into Markdown text and raw blocks of parameters, exceptions and return value.
+
+        Arguments:
+            docstring: The docstring to split.
+
+        Returns:
+            A tuple of split sections.
+        """
+        replace_admonitions = self.replace_admonitions
+        sections: List[SplitSection] = []
+        # the current Markdown section spans lines from `current_start` to the current line
+        current_start = 0
+        current_has_content = False
 
         in_code_block = False
 
-        lines = docstring.split("\n")
+        # split on newlines only, ignoring trailing ones: an empty docstring still gives one empty line
+        lines = docstring.rstrip("\n").split("\n")
         i = 0
 
-        while i < len(lines):
-            line_lower = lines[i].lower()
+        def flush_current_section(end: int) -> None:
+            nonlocal current_has_content
+            if current_has_content:
+                text = "\n".join(lines[current_start:end])
+                sections.append((Section.Type.MARKDOWN, text, (), current_start, ()))
+            current_has_content = False
+
+        n_lines = len(lines)
+        while i < n_lines:
+            line = lines[i]
 
             if in_code_block:
-                if line_lower.lstrip(" ").startswith("```"):
+                if RE_CODE_FENCE.match(line) is not None:
                     in_code_block = False
-                current_section.append(lines[i])
-
-            elif line_lower in TITLES_PARAMETERS:
-                if current_section:
-                    if any(current_section):
-                        sections.append(Section(Section.Type.MARKDOWN, "\n".join(current_section)))
-                    current_section = []
-                section, i = self.read_parameters_section(lines, i + 1)
-                if section:
-                    sections.append(section)
-
-            elif line_lower in TITLES_EXCEPTIONS:
-                if current_section:
-                    if any(current_section):
-                        sections.append(Section(Section.Type.MARKDOWN, "\n".join(current_section)))
-                    current_section = []
-                section, i = self.read_exceptions_section(lines, i + 1)
-                if section:
-                    sections.append(section)
-
-            elif line_lower in TITLES_RETURN:
-                if current_section:
-                    if any(current_section):
-                        sections.append(Section(Section.Type.MARKDOWN, "\n".join(current_section)))
-                    current_section = []
-                section, i = self.read_return_section(lines, i + 1)
-                if section:
-                    sections.append(section)
-
-            elif line_lower.lstrip(" ").startswith("```"):
-                in_code_block = True
-                current_section.append(lines[i])
 
             else:
-                if self.replace_admonitions and not in_code_block and i + 1 < len(lines):
-                    match = RE_GOOGLE_STYLE_ADMONITION.match(lines[i])
+                section_type = None
+                # titles are short, start with a known letter and end with a colon:
+                # don't lowercase lines that can't be titles
+                if line[:1] in TITLES_FIRST_CHARACTERS and line.endswith(":") and len(line) <= TITLES_MAX_LENGTH:
+                    section_type = TITLES_SECTIONS.get(line.lower())
+
+                if section_type is not None:
+                    flush_current_section(i)
+                    section, end_index = self.read_section_block(section_type, lines, i + 1)
+                    sections.append(section)
+                    i = end_index + 1
+                    current_start = i
+                    continue
+
+                if RE_CODE_FENCE.match(line) is not None:
+                    in_code_block = True
+
+                elif replace_admonitions and i + 1 < n_lines:
+                    # the admonition type is a word directly followed by the first colon of the line:
+                    # only run the regular expression on lines where this is possible
+                    colon = line.find(":")
+                    match = None
+                    if colon > 0 and (line[colon - 1].isalnum() or line[colon - 1] in "_-"):
+                        match = RE_GOOGLE_STYLE_ADMONITION.match(line)
                     if match:
                         groups = match.groupdict()
                         indent = groups["indent"]
                         if lines[i + 1].startswith(indent + " " * 4):
-                            lines[i] = f"{indent}!!! {groups['type'].lower()}"
+                            line = f"{indent}!!! {groups['type'].lower()}"
                             if groups["title"]:
-                                lines[i] += f' "{groups["title"]}"'
-                current_section.append(lines[i])
+                                line += f' "{groups["title"]}"'
+                            lines[i] = line
 
+            if line:
+                current_has_content = True
             i += 1
 
-        if current_section:
-            sections.append(Section(Section.Type.MARKDOWN, "\n".join(current_section)))
+        if current_start < n_lines:
+            sections.append((Section.Type.MARKDOWN, "\n".join(lines[current_start:]), (), current_start, ()))
 
-        return sections
+        return tuple(sections)
+
+    def read_section_block(self, section_type: str, lines: List[str], start_index: int) -> Tuple[SplitSection, int]:
+        """
+        Read the raw block of a section, keeping the errors met to replay them each time the docstring is parsed.
+
+        Arguments:
+            section_type: The type of the section, from the [`Type`][pytkdocs.parsers.docstrings.base.Section.Type] enum.
+            lines: The docstring lines.
+            start_index: The line number to start at.
+
+        Returns:
+            A tuple containing the split section and the index at which to continue parsing.
+        """
+        self._split_errors = []
+        try:
+            text = ""
+            items: Tuple[str, ...] = ()
+            if section_type == Section.Type.RETURN:
+                text, end_index = self.read_block(lines, start_index)
+            else:
+                block, end_index = self.read_block_items(lines, start_index)
+                items = tuple(block)
+            return (section_type, text, items, start_index, tuple(self._split_errors)), end_index
+        finally:
+            self._split_errors = None
 
     @staticmethod
-    def is_empty_line(line) -> bool:
+    def is_empty_line(line: str) -> bool:
         """
         Tell if a line is empty.
 
@@ -147,14 +271,17 @@ class Google(Parser):
         i += 1
 
         # loop on next lines
+        indent_x2 = indent * 2
         while i < len(lines):
             line = lines[i]
+            # measure the indentation once, then compare it to the initial one
+            lead = len(line) - len(line.lstrip(" "))
 
-            if line.startswith(indent * 2 * " "):
+            if lead >= indent_x2:
                 # continuation line
-                current_item.append(line[indent * 2 :])
+                current_item.append(line[indent_x2:])
 
-            elif line.startswith((indent + 1) * " "):
+            elif lead > indent:
                 # indent between initial and continuation: append but add error
                 cont_indent = len(line) - len(line.lstrip())
                 current_item.append(line[cont_indent:])
@@ -163,12 +290,12 @@ class Google(Parser):
                     f"should be {indent} * 2 = {indent*2} spaces, not {cont_indent}"
                 )
 
-            elif line.startswith(indent * " "):
+            elif lead == indent:
                 # indent equal to initial one: new item
                 items.append("\n".join(current_item))
                 current_item = [line[indent:]]
 
-            elif self.is_empty_line(line):
+            elif not line or line.isspace():
                 # empty line: preserve it in the current item
                 current_item.append("")
 
@@ -216,26 +343,30 @@ class Google(Parser):
         i += 1
 
         # loop on next lines
-        while i < len(lines) and (lines[i].startswith(indent * " ") or self.is_empty_line(lines[i])):
+        prefix = " " * indent
+        n_lines = len(lines)
+        while i < n_lines and (lines[i].startswith(prefix) or not lines[i] or lines[i].isspace()):
             block.append(lines[i][indent:])
             i += 1
 
         return "\n".join(block).rstrip("\n"), i - 1
 
-    def read_parameters_section(self, lines: List[str], start_index: int) -> Tuple[Optional[Section], int]:
+    def parse_parameters_block(self, block: Sequence[str], start_index: int) -> Optional[Section]:
         """
-        Parse a "parameters" section.
+        Parse the items of a "parameters" block.
 
         Arguments:
-            lines: The parameters block lines.
-            start_index: The line number to start at.
+            block: The parameters block items.
+            start_index: The line number the block started at.
 
         Returns:
-            A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
+            A `Section` or `None`.
         """
         parameters = []
         type_: Any
-        block, i = self.read_block_items(lines, start_index)
+        signature_params: Mapping[str, inspect.Parameter] = {}
+        if self.object_signature is not None:
+            signature_params = self.object_signature.parameters
 
         for param_line in block:
             try:
@@ -259,9 +390,8 @@ class Google(Parser):
             annotation = type_
             kind = None
 
-            try:
-                signature_param = self.object_signature.parameters[name.lstrip("*")]  # type: ignore
-            except (AttributeError, KeyError):
+            signature_param = signature_params.get(name.lstrip("*"))
+            if signature_param is None:
                 self.error(f"No type annotation for parameter '{name}'")
             else:
                 if signature_param.annotation is not empty:
@@ -275,24 +405,23 @@ class Google(Parser):
             )
 
         if parameters:
-            return Section(Section.Type.PARAMETERS, parameters), i
+            return Section(Section.Type.PARAMETERS, parameters)
 
         self.error(f"Empty parameters section at line {start_index}")
-        return None, i
+        return None
 
-    def read_exceptions_section(self, lines: List[str], start_index: int) -> Tuple[Optional[Section], int]:
+    def parse_exceptions_block(self, block: Sequence[str], start_index: int) -> Optional[Section]:
         """
-        Parse an "exceptions" section.
+        Parse the items of an "exceptions" block.
 
         Arguments:
-            lines: The exceptions block lines.
-            start_index: The line number to start at.
+            block: The exceptions block items.
+            start_index: The line number the block started at.
 
         Returns:
-            A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
+            A `Section` or `None`.
         """
         exceptions = []
-        block, i = self.read_block_items(lines, start_index)
 
         for exception_line in block:
             try:
@@ -303,24 +432,22 @@ class Google(Parser):
                 exceptions.append(AnnotatedObject(annotation, description.lstrip(" ")))
 
         if exceptions:
-            return Section(Section.Type.EXCEPTIONS, exceptions), i
+            return Section(Section.Type.EXCEPTIONS, exceptions)
 
         self.error(f"Empty exceptions section at line {start_index}")
-        return None, i
+        return None
 
-    def read_return_section(self, lines: List[str], start_index: int) -> Tuple[Optional[Section], int]:
+    def parse_return_block(self, text: str, start_index: int) -> Optional[Section]:
         """
-        Parse an "returns" section.
+        Parse the text of a "returns" block.
 
         Arguments:
-            lines: The return block lines.
-            start_index: The line number to start at.
+            text: The return block text.
+            start_index: The line number the block started at.
 
         Returns:
-            A tuple containing a `Section` (or `None`) and the index at which to continue parsing.
+            A `Section` or `None`.
         """
-        text, i = self.read_block(lines, start_index)
-
         if self.object_signature:
             annotation = self.object_signature.return_annotation
         else:
@@ -340,6 +467,6 @@ class Google(Parser):
 
         if annotation is empty and not text:
             self.error(f"Empty return section at line {start_index}")
-            return None, i
+            return None
 
-        return Section(Section.Type.RETURN, AnnotatedObject(annotation, text)), i
+        return Section(Section.Type.RETURN, AnnotatedObject(annotation, text))
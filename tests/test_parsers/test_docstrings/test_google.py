@@ -19,6 +19,22 @@ def test_simple_docstring():
     assert not errors
 
 
+def test_empty_docstring():
+    """Parse an empty docstring."""
+    sections, errors = parse("")
+    assert len(sections) == 1
+    assert sections[0].value == ""
+    assert not errors
+
+
+def test_line_boundaries_other_than_newline():
+    """Only split docstrings on newlines, ignoring trailing ones."""
+    sections, errors = Google().parse("Summary.\x0cPage two\n\n", "o")
+    assert len(sections) == 1
+    assert sections[0].value == "Summary.\x0cPage two"
+    assert not errors
+
+
 def test_multi_line_docstring():
     """Parse a multi-line docstring."""
     sections, errors = parse(
@@ -449,3 +465,64 @@ def test_different_indentation():
     assert sections[2].value == "    AnyLine: ...indented with less than 5 spaces signifies the end of the section."
     assert len(errors) == 1
     assert "should be 5 * 2 = 10 spaces, not 6" in errors[0]
+
+
+def test_reuse_split_docstring():
+    """Parse the same docstring for different objects with a single parser."""
+    docstring = dedent(
+        """
+        Same docstring.
+
+        Parameters:
+            x: An integer.
+              Badly indented continuation line (will trigger an error).
+        """
+    ).strip()
+
+    def f(x: int):
+        return x
+
+    def g(x: str):
+        return x
+
+    parser = Google()
+    f_sections, f_errors = parser.parse(docstring, "f", inspect.signature(f))
+    g_sections, g_errors = parser.parse(docstring, "g", inspect.signature(g))
+    assert f_sections[1].value[0].annotation is int
+    assert g_sections[1].value[0].annotation is str
+    assert len(f_errors) == len(g_errors) == 1
+    assert f_errors[0].startswith("f: Confusing indentation")
+    assert g_errors[0].startswith("g: Confusing indentation")
+
+    parser.clear_cache()
+    sections, errors = parser.parse(docstring, "f", inspect.signature(f))
+    assert sections[1].value[0].annotation is int
+    assert errors == f_errors
+
+
+def test_subclass_parser():
+    """Use the methods and state of parsers subclassing the Google parser."""
+
+    class PrefixingGoogle(Google):
+        def __init__(self, prefix):
+            super().__init__()
+            self.prefix = prefix
+
+        def parse_parameters_block(self, block, start_index):
+            section = super().parse_parameters_block(block, start_index)
+            for parameter in section.value:
+                parameter.description = self.prefix + parameter.description
+            return section
+
+    def f(x: int):
+        """
+        Parameters:
+            x: An integer.
+        """
+        return x
+
+    parser = PrefixingGoogle("> ")
+    for _ in range(2):
+        sections, errors = parser.parse(inspect.getdoc(f), "f", inspect.signature(f))
+        assert sections[0].value[0].description == "> An integer."
+        assert not errors